@@ -4,7 +4,6 @@ from warnings import warn
 
 import gmso
 import numpy as np
-import scipy
 import unyt as u
 from mbuild.box import Box
 from mbuild.compound import Compound
@@ -319,7 +318,11 @@ def _Exp6_Rmin_to_sigma_solver(
             f"as it divides by zero. "
             f"The entered values are Rmin = {Rmin_actual} and alpha = {alpha_actual}."
         )
-    exp6_sigma_solver = scipy.optimize.root(
+    # import scipy.optimize explicitly, as a bare 'import scipy'
+    # does not load the scipy.optimize submodule
+    from scipy.optimize import root
+
+    exp6_sigma_solver = root(
         lambda sigma: _Exp6_Rmin_to_sigma(sigma, Rmin_actual, alpha_actual),
         Rmin_actual * Rmin_fraction_for_sigma_findroot,
     )
@@ -340,6 +343,36 @@ def _Exp6_Rmin_to_sigma_solver(
     return sigma_calculated
 
 
+def _Exp6_Rmin_to_sigma_solver_memoized(
+    Rmin_actual, alpha_actual, sigma_per_Rmin_and_alpha_dict
+):
+    """
+    Numerically solve the Exp6 sigma value, only if the Rmin and alpha pair is not already solved.
+
+    Parameters
+    ----------
+    Rmin_actual: variable
+        The Rmin value for the non-bonded Exp6 potential energy equation.
+    alpha_actual: int or float
+        The alpha value for the non-bonded Exp6 potential energy equation.
+    sigma_per_Rmin_and_alpha_dict: dict
+        The already solved sigma values, {(Rmin, alpha): sigma, ...},
+        which is updated with the newly solved sigma value.
+
+    Returns
+    ----------
+    sigma_calculated: float
+        The numerically solved sigma value for the non-bonded Exp6 potential energy equation.
+    """
+    Rmin_and_alpha = (Rmin_actual, alpha_actual)
+    if Rmin_and_alpha not in sigma_per_Rmin_and_alpha_dict:
+        sigma_per_Rmin_and_alpha_dict[Rmin_and_alpha] = (
+            _Exp6_Rmin_to_sigma_solver(Rmin_actual, alpha_actual)
+        )
+
+    return sigma_per_Rmin_and_alpha_dict[Rmin_and_alpha]
+
+
 def _Exp6_sigma_to_Rmin(Rmin, sigma, alpha):
     """Get equation to convert Rmin to sigma for the Exponential-6 (Exp6) potential energy equation.
 
@@ -409,7 +442,9 @@ def _Exp6_sigma_to_Rmin_solver(
             f"The entered values are sigma = {sigma_actual} and alpha = {alpha_actual}."
         )
 
-    exp6_Rmin_solver = scipy.optimize.root(
+    from scipy.optimize import root
+
+    exp6_Rmin_solver = root(
         lambda Rmin: _Exp6_sigma_to_Rmin(Rmin, sigma_actual, alpha_actual),
         sigma_actual * sigma_fraction_for_Rmin_findroot,
     )
@@ -466,25 +501,46 @@ def unique_atom_naming(
     unique_individual_atom_names_dict = {}
     individual_atom_names_list = []
     missing_bead_to_atom_name = []
+    element_name_per_site_name_dict = {}
+    last_unique_name_number_dict = {}
     for i, site in enumerate(topology.sites):
         site_name_unique_naming = site.__dict__["name_"]
 
-        # extract element or atom name from mol2 without numbers (integers)
-        element_name_unique_naming = ""
-        for site_name_unique_naming_char_i in site_name_unique_naming:
-            try:
-                int(site_name_unique_naming_char_i)
+        # extract element or atom name from mol2 without numbers (integers),
+        # which is only done once per site name, as the names repeat for every molecule
+        if site_name_unique_naming not in element_name_per_site_name_dict:
+            element_name_per_site_name_iter = ""
+            for site_name_unique_naming_char_i in site_name_unique_naming:
+                try:
+                    int(site_name_unique_naming_char_i)
 
-            except:
-                element_name_unique_naming += site_name_unique_naming_char_i
+                except:
+                    element_name_per_site_name_iter += (
+                        site_name_unique_naming_char_i
+                    )
+
+            element_name_per_site_name_dict[site_name_unique_naming] = (
+                element_name_per_site_name_iter
+            )
+
+        element_name_unique_naming = element_name_per_site_name_dict[
+            site_name_unique_naming
+        ]
 
         if element_name_unique_naming == "":
             raise ValueError(
                 "ERROR: The input file, likely mol2 file does not contain element names or char, only int."
             )
 
+        # start the unique name search after the last number used for this site name
+        # in this residue, since all the lower numbers are already taken
+        unique_name_number_key = (
+            residue_id_list[i],
+            residue_names_list[i],
+            site_name_unique_naming,
+        )
         interate_thru_names = True
-        j = 0
+        j = last_unique_name_number_dict.get(unique_name_number_key, 0)
         while interate_thru_names is True:
             j = j + 1
             if str(site_name_unique_naming)[:1] == "_":
@@ -560,6 +616,8 @@ def unique_atom_naming(
                     )
                 )
 
+        last_unique_name_number_dict[unique_name_number_key] = j
+
     if sum(missing_bead_to_atom_name) > 0:
         warn(
             "NOTE: All bead names were not found in the Bead to atom naming dictionary (bead_to_atom_name_dict) "
@@ -1777,6 +1835,7 @@ class Charmm:
                 for site in self.topology_box_0_ff.sites
             ]
 
+            total_charge_box_0 = 0.0
             if len(charge_list_box_0) != 0:
                 total_charge_box_0 = sum(charge_list_box_0)
                 total_charge_box_0 = total_charge_box_0.to_value(
@@ -1794,6 +1853,7 @@ class Charmm:
                 site.atom_type.__dict__["charge_"].to("C") / u.elementary_charge
                 for site in self.topology_box_1_ff.sites
             ]
+            total_charge_box_1 = 0.0
             if len(charge_list_box_1) != 0:
                 total_charge_box_1 = sum(charge_list_box_1)
                 total_charge_box_1 = total_charge_box_1.to_value(
@@ -1806,14 +1866,10 @@ class Charmm:
                         "Total charge is {}.".format(total_charge_box_1)
                     )
 
-            # Check if the box 0 and 1's charges sum to zero
-            charge_list_box_0_and_1 = [
-                site.atom_type.__dict__["charge_"].to("C") / u.elementary_charge
-                for site in self.topology_box_0_and_1_ff.sites
-            ]
-            total_charge_box_0_and_1 = sum(charge_list_box_0_and_1).to_value(
-                "(dimensionless)"
-            )
+            # Check if the box 0 and 1's charges sum to zero.
+            # The combined topology has the same sites as box 0 and 1,
+            # so reuse their totals instead of recalculating every site's charge.
+            total_charge_box_0_and_1 = total_charge_box_0 + total_charge_box_1
             if round(total_charge_box_0_and_1, 6) != 0.0:
                 warn(
                     "System is not charge neutral for structure_0_and_1. "
@@ -1934,8 +1990,24 @@ class Charmm:
         # Example: {'ff_atom_name': {'atomclass': 'CT', 'description': 'alkane CH3',
         # 'definition': '[C;X4](C)(H)(H)H]', 'doi': 'doi.xxxx' }, ..., }
         self.atom_type_info_dict = {}
+
+        # group the sites by their residue and MoSDeF atom type, which all have the same
+        # force field parameters, so the parameters are only read and unit converted
+        # once per group, then broadcast back to every site via the site's group index.
+        residue_atom_type_group_index_dict = {}
+        residue_atom_type_group_sites_list = []
+        site_group_index_list = []
         for site in self.topology_selection.sites:
             key_iter = f"{site.__dict__['residue_name_']}_{site.atom_type.__dict__['name_']}"
+            if key_iter not in residue_atom_type_group_index_dict:
+                residue_atom_type_group_index_dict[key_iter] = len(
+                    residue_atom_type_group_sites_list
+                )
+                residue_atom_type_group_sites_list.append(site)
+            site_group_index_list.append(
+                residue_atom_type_group_index_dict[key_iter]
+            )
+
             if key_iter not in self.atom_type_info_dict.keys():
                 charge_value = (
                     site.atom_type.__dict__["charge_"].to("C")
@@ -2134,9 +2206,9 @@ class Charmm:
         self.masses = np.array(
             [
                 site.atom_type.__dict__["mass_"].to_value("amu")
-                for site in self.topology_selection.sites
+                for site in residue_atom_type_group_sites_list
             ]
-        )
+        )[site_group_index_list]
 
         self.mass_atom_type_dict = dict(
             [
@@ -2157,9 +2229,9 @@ class Charmm:
                     site.atom_type.__dict__["charge_"].to("C")
                     / u.elementary_charge
                 ).to_value("(dimensionless)")
-                for site in self.topology_selection.sites
+                for site in residue_atom_type_group_sites_list
             ]
-        )
+        )[site_group_index_list]
         self.charges_atom_type_dict = dict(
             [
                 (atom_type, charge)
@@ -2299,9 +2371,9 @@ class Charmm:
                 * self.atom_type_experssion_and_scalar_combined[
                     f'{site.__dict__["residue_name_"]}_{site.atom_type.__dict__["name_"]}'
                 ]["expression_scalar"]
-                for site in self.topology_selection.sites
+                for site in residue_atom_type_group_sites_list
             ]
-        )
+        )[site_group_index_list]
         self.epsilon_kcal_per_mol_atom_class_dict = dict(
             [
                 (atom_class, epsilon)
@@ -2324,7 +2396,7 @@ class Charmm:
             # Therefore, we check if m=6 for all, and if not this writer will fail
             self.mie_m_required_value = 6
 
-            for site in self.topology_selection.sites:
+            for site in residue_atom_type_group_sites_list:
                 atom_type_residue_iter = f"{site.__dict__['residue_name_']}_{site.atom_type.__dict__['name_']}"
                 nonbonded_expresseion_iter = (
                     self.atom_type_experssion_and_scalar_combined[
@@ -2360,7 +2432,7 @@ class Charmm:
                     mie_n_iter = 12
                     mie_n.append(mie_n_iter)
 
-            mie_n = np.array(mie_n)
+            mie_n = np.array(mie_n)[site_group_index_list]
 
             self.mie_n_atom_type_dict = dict(
                 [
@@ -2381,10 +2453,14 @@ class Charmm:
         # get the sigma values for the LJ and Mie forms calculate sigmas based on FF type
         sigmas_angstrom = []
         if self.utilized_NB_expression in ["LJ", "Mie"]:
-            for site in self.topology_selection.sites:
-                sigmas_angstrom.append(
-                    site.atom_type.parameters["sigma"].to("angstrom").to_value()
-                )
+            sigmas_angstrom_per_group = [
+                site.atom_type.parameters["sigma"].to("angstrom").to_value()
+                for site in residue_atom_type_group_sites_list
+            ]
+            sigmas_angstrom = [
+                sigmas_angstrom_per_group[group_index_i]
+                for group_index_i in site_group_index_list
+            ]
 
             # List the sigma values for the LJ and Mie FF types
             self.sigma_angstrom_atom_type_dict = dict(
@@ -2402,13 +2478,6 @@ class Charmm:
 
         # get the sigma values for the Exp6 forms calculate sigmas based on FF type
         elif self.utilized_NB_expression in ["Exp6"]:
-            for site in self.topology_selection.sites:
-                atom_type_residue_iter = f"{site.__dict__['residue_name_']}_{site.atom_type.__dict__['name_']}"
-                nonbonded_expresseion_iter = (
-                    self.atom_type_experssion_and_scalar_combined[
-                        atom_type_residue_iter
-                    ]["expression_form"]
-                )
             # Brad note: start here next time
             # get the exp6 alpha values
             exp6_alpha_unitless = np.array(
@@ -2416,9 +2485,9 @@ class Charmm:
                     site.atom_type.parameters["alpha"]
                     .to("dimensionless")
                     .to_value()
-                    for site in self.topology_selection.sites
+                    for site in residue_atom_type_group_sites_list
                 ]
-            )
+            )[site_group_index_list]
             self.exp6_alpha_atom_class_dict = dict(
                 [
                     (atom_class, alpha)
@@ -2438,9 +2507,9 @@ class Charmm:
             exp6_r_min_angstrom = np.array(
                 [
                     site.atom_type.parameters["Rmin"].to("angstrom").to_value()
-                    for site in self.topology_selection.sites
+                    for site in residue_atom_type_group_sites_list
                 ]
-            )
+            )[site_group_index_list]
 
             self.exp6_r_min_angstrom_atom_class_dict = dict(
                 [
@@ -2457,6 +2526,12 @@ class Charmm:
                 ]
             )
 
+            # Store the numerically solved Exp6 sigmas for each (Rmin, alpha) pair,
+            # so each pair is only solved once for both the atom class and atom type dicts,
+            # as many atom classes and types share the same Exp6 Rmin and alpha values.
+            # Example: {(Rmin, alpha): sigma, ...}
+            exp6_sigma_per_r_min_and_alpha_dict = {}
+
             # Get the Exp6 sigma atom_class_dict by looping the other atom_class_dict dictionaries.
             # Use the Exp6 alpha and Rmin values to numerically convert Rmin --> Sigma.
             # There is no analytical conversion.
@@ -2470,9 +2545,12 @@ class Charmm:
                 # get the corresponding alpha for Exp6
                 alpha_exp6_iter = self.exp6_alpha_atom_class_dict[exp6_key]
 
-                # use scipy to numerically solve for sigma for atom class dict
-                exp6_sigma_iter = _Exp6_Rmin_to_sigma_solver(
-                    r_min_exp6_iter, alpha_exp6_iter
+                # use scipy to numerically solve for sigma for atom class dict,
+                # if this Rmin and alpha pair has not been solved already
+                exp6_sigma_iter = _Exp6_Rmin_to_sigma_solver_memoized(
+                    r_min_exp6_iter,
+                    alpha_exp6_iter,
+                    exp6_sigma_per_r_min_and_alpha_dict,
                 )
 
                 self.sigma_angstrom_atom_class_dict.update(
@@ -2492,9 +2570,12 @@ class Charmm:
                 # get the corresponding alpha for Exp6
                 alpha_exp6_iter = self.exp6_alpha_atom_type_dict[exp6_key]
 
-                # use scipy to numerically solve for sigma for atom type dict
-                exp6_sigma_iter = _Exp6_Rmin_to_sigma_solver(
-                    r_min_exp6_iter, alpha_exp6_iter
+                # use scipy to numerically solve for sigma for atom type dict,
+                # if this Rmin and alpha pair has not been solved already
+                exp6_sigma_iter = _Exp6_Rmin_to_sigma_solver_memoized(
+                    r_min_exp6_iter,
+                    alpha_exp6_iter,
+                    exp6_sigma_per_r_min_and_alpha_dict,
                 )
 
                 self.sigma_angstrom_atom_type_dict.update(
@@ -3014,19 +3095,14 @@ class Charmm:
             raise ValueError(print_error_message)
 
         else:
+            # single pass over the atoms, without rebuilding the list of keys for every atom
             self.all_res_unique_atom_name_dict = {}
-            for res_i in range(0, len(self.all_individual_atom_names_list)):
-                if self.all_res_unique_atom_name_dict in list(
-                    self.all_res_unique_atom_name_dict.keys()
-                ):
-                    self.all_res_unique_atom_name_dict.setdefault(
-                        self.all_residue_names_list[res_i], set()
-                    ).add(self.all_individual_atom_names_list[res_i])
-
-                else:
-                    self.all_res_unique_atom_name_dict.setdefault(
-                        self.all_residue_names_list[res_i], set()
-                    ).add(self.all_individual_atom_names_list[res_i])
+            for residue_name_i, atom_name_i in zip(
+                self.all_residue_names_list, self.all_individual_atom_names_list
+            ):
+                self.all_res_unique_atom_name_dict.setdefault(
+                    residue_name_i, set()
+                ).add(atom_name_i)
 
         print(
             "all_res_unique_atom_name_dict = {}".format(
@@ -3064,25 +3140,13 @@ class Charmm:
             print("writing the GOMC force field file ")
             date_time = datetime.datetime.today()
 
-            residue_id_list = []
-            residue_names_list = []
-
-            if self.structure_box_1:
-                for k, site in enumerate(self.topology_box_0_ff.sites):
-                    residue_id_list.append(site.__dict__["residue_number_"])
-                    residue_names_list.append(site.__dict__["residue_name_"])
+            # reuse the box 0 and 1 residue names (in site order), which were
+            # already gathered when the Charmm object was built,
+            # instead of iterating through all the sites again
+            residue_names_list = self.all_residue_names_list
 
-                for k, site in enumerate(self.topology_box_1_ff.sites):
-                    residue_id_list.append(site.__dict__["residue_number_"])
-                    residue_names_list.append(site.__dict__["residue_name_"])
-
-            else:
-                for k, site in enumerate(self.topology_box_0_ff.sites):
-                    residue_id_list.append(site.__dict__["residue_number_"])
-                    residue_names_list.append(site.__dict__["residue_name_"])
-
-            for n in range(0, len(residue_names_list)):
-                if residue_names_list[n] not in self.residues:
+            for residue_name_n in set(residue_names_list):
+                if residue_name_n not in self.residues:
                     print("residue_names_list = " + str(residue_names_list))
                     self.input_error = True
                     print_error_message = "ERROR: Please specifiy all residues (residues) in a list"
@@ -4980,6 +5044,22 @@ class Charmm:
 
         # calculate the atom name and  (instead of: atom.occupancy)
 
+        # build the psf atom type, charge, and mass table once for each residue and
+        # MoSDeF atom type, so the unit conversions are not redone for every site.
+        # Example: {'residue_name_atom_type': (charmm_atom_type, charge, mass), ...}
+        psf_atom_type_charge_mass_dict = {}
+        for (
+            residue_atom_type_key_j,
+            atom_type_info_j,
+        ) in self.atom_type_info_dict.items():
+            psf_atom_type_charge_mass_dict[residue_atom_type_key_j] = (
+                self.mosdef_atom_name_to_atom_type_dict[
+                    residue_atom_type_key_j
+                ],
+                atom_type_info_j["charge_"],
+                atom_type_info_j["mass_"].to_value("amu"),
+            )
+
         if self.structure_box_1:
             list_of_topologies = [
                 self.topology_box_0_ff,
@@ -5084,25 +5164,18 @@ class Charmm:
             for i_atom, PSF_atom_iteration_1 in enumerate(
                 stuct_iteration.sites
             ):
-                charge_iter = (
-                    PSF_atom_iteration_1.atom_type.__dict__["charge_"].to("C")
-                    / u.elementary_charge
-                )
-                charge_iter = charge_iter.to_value("(dimensionless)")
-                mass_iter = PSF_atom_iteration_1.atom_type.__dict__[
-                    "mass_"
-                ].to_value("amu")
                 residue_name_iter = PSF_atom_iteration_1.__dict__[
                     "residue_name_"
                 ]
-                atom_class_name_iter = PSF_atom_iteration_1.atom_type.__dict__[
-                    "atomclass_"
-                ]
                 atom_type_name_iter = PSF_atom_iteration_1.atom_type.__dict__[
                     "name_"
                 ]
 
-                atom_type_iter = self.mosdef_atom_name_to_atom_type_dict[
+                [
+                    atom_type_iter,
+                    charge_iter,
+                    mass_iter,
+                ] = psf_atom_type_charge_mass_dict[
                     f"{residue_name_iter}_{atom_type_name_iter}"
                 ]
 
@@ -5123,20 +5196,21 @@ class Charmm:
 
             output_write.write("\n")
 
+            # map each site to its psf atom number (index + 1) once, so the bonds, angles,
+            # dihedrals, and impropers atom numbers are dictionary lookups, rather than
+            # a topology get_index call for every connection member
+            psf_atom_number_per_site_dict = {
+                site_j: j + 1 for j, site_j in enumerate(stuct_iteration.sites)
+            }
+
             # BONDS: Calculate the bonding data
             output_write.write(first_indent % no_bonds + " !NBOND: bonds\n")
             for i_bond, bond_iteration in enumerate(stuct_iteration.bonds):
                 output_write.write(
                     (first_indent * 2)
-                    % (
-                        stuct_iteration.get_index(
-                            bond_iteration.connection_members[0]
-                        )
-                        + 1,
-                        stuct_iteration.get_index(
-                            bond_iteration.connection_members[1]
-                        )
-                        + 1,
+                    % tuple(
+                        psf_atom_number_per_site_dict[member_j]
+                        for member_j in bond_iteration.connection_members
                     )
                 )
 
@@ -5156,19 +5230,9 @@ class Charmm:
             for i_angle, angle_iteration in enumerate(stuct_iteration.angles):
                 output_write.write(
                     (first_indent * 3)
-                    % (
-                        stuct_iteration.get_index(
-                            angle_iteration.connection_members[0]
-                        )
-                        + 1,
-                        stuct_iteration.get_index(
-                            angle_iteration.connection_members[1]
-                        )
-                        + 1,
-                        stuct_iteration.get_index(
-                            angle_iteration.connection_members[2]
-                        )
-                        + 1,
+                    % tuple(
+                        psf_atom_number_per_site_dict[member_j]
+                        for member_j in angle_iteration.connection_members
                     )
                 )
 
@@ -5192,23 +5256,9 @@ class Charmm:
             ):
                 output_write.write(
                     (first_indent * 4)
-                    % (
-                        stuct_iteration.get_index(
-                            dihedral_iter.connection_members[0]
-                        )
-                        + 1,
-                        stuct_iteration.get_index(
-                            dihedral_iter.connection_members[1]
-                        )
-                        + 1,
-                        stuct_iteration.get_index(
-                            dihedral_iter.connection_members[2]
-                        )
-                        + 1,
-                        stuct_iteration.get_index(
-                            dihedral_iter.connection_members[3]
-                        )
-                        + 1,
+                    % tuple(
+                        psf_atom_number_per_site_dict[member_j]
+                        for member_j in dihedral_iter.connection_members
                     )
                 )
 
@@ -5232,23 +5282,9 @@ class Charmm:
             ):
                 output_write.write(
                     (first_indent * 4)
-                    % (
-                        stuct_iteration.get_index(
-                            improper_iter.connection_members[0]
-                        )
-                        + 1,
-                        stuct_iteration.get_index(
-                            improper_iter.connection_members[1]
-                        )
-                        + 1,
-                        stuct_iteration.get_index(
-                            improper_iter.connection_members[2]
-                        )
-                        + 1,
-                        stuct_iteration.get_index(
-                            improper_iter.connection_members[3]
-                        )
-                        + 1,
+                    % tuple(
+                        psf_atom_number_per_site_dict[member_j]
+                        for member_j in improper_iter.connection_members
                     )
                 )
 
@@ -5372,16 +5408,14 @@ class Charmm:
             # caluculate the atom name and unique atom names
             max_no_atoms_in_base10 = 99999  # 99,999 for atoms in psf/pdb
 
-            atom_no_list = []
             element_list = []
 
             occupancy_values_atoms_list = []
             fix_atoms_list = []
-            atom_alternate_location_list = []
-            residue_code_insertion_list = []
             x_y_z_coor_list = []
-            segment_id = []
 
+            # the alternate location, residue insertion code, and segment id are the same
+            # for every atom, so the single values are written directly for each atom
             atom_alternate_location_all_values = ""
             residue_code_insertion_all_values = ""
             segment_id_all_values = ""
@@ -5391,9 +5425,6 @@ class Charmm:
                     print_error_message = "ERROR: Please specifiy all residues (residues) in a list"
                     raise ValueError(print_error_message)
 
-                # get other values
-                atom_no_list.append(stuct_only_iteration.get_index(site))
-
                 # only 2 character element names are allowed
                 site_name = str(site.__dict__["name_"])
 
@@ -5440,18 +5471,9 @@ class Charmm:
                     occupancy_iteration = 0.00
                 occupancy_values_atoms_list.append(occupancy_iteration)
 
-                atom_alternate_location_list.append(
-                    atom_alternate_location_all_values
-                )
-                residue_code_insertion_list.append(
-                    residue_code_insertion_all_values
-                )
-
                 x_y_z_coor = site.__dict__["position_"].to_value("angstrom")
                 x_y_z_coor_list.append(x_y_z_coor)
 
-                segment_id.append(segment_id_all_values)
-
             if (self.fix_residue is not None) and (
                 self.fix_residue_in_box is not None
             ):
@@ -5520,17 +5542,17 @@ class Charmm:
                     % (
                         atom_number,
                         individual_atom_names_list[v],
-                        atom_alternate_location_list[v],
+                        atom_alternate_location_all_values,
                         str(residue_names_list_pdb[v])[: self.max_resname_char],
                         segment_id_list_pdb[v],
                         res_no_chain_iter_corrected_list_pdb[v],
-                        residue_code_insertion_list[v],
+                        residue_code_insertion_all_values,
                         x_y_z_coor_list[v][0],
                         x_y_z_coor_list[v][1],
                         x_y_z_coor_list[v][2],
                         occupancy_values_atoms_list[v],
                         fix_atoms_list[v],
-                        segment_id[v],
+                        segment_id_all_values,
                         element_list[v],
                         "",
                     )
@@ -2,7 +2,7 @@ import mbuild as mb
 import numpy as np
 import pytest
 from foyer.forcefields import forcefields
-from gmso import Topology
+from gmso import Atom, Topology
 from gmso.exceptions import GMSOError
 from gmso.external.convert_mbuild import from_mbuild, to_mbuild
 from mbuild import Box, Compound
@@ -15,6 +15,7 @@ from mosdef_gomc.formats.gmso_charmm_writer import (
     _Exp6_Rmin_to_sigma_solver,
     _Exp6_sigma_to_Rmin,
     _Exp6_sigma_to_Rmin_solver,
+    unique_atom_naming,
 )
 from mosdef_gomc.tests.base_test import BaseTest
 from mosdef_gomc.utils.conversion import (
@@ -4500,6 +4501,49 @@ class TestCharmmWriterData(BaseTest):
             value_0.write_pdb()
             value_0.write_psf()
 
+    def test_unique_atom_naming_interleaved_site_names(self):
+        # site names sharing the same element (C1, C2, C1, C) and bead names
+        # mapped to the same atom name (_CH3, _CH2 --> C) are interleaved in each residue
+        site_names = ["C1", "C2", "C1", "H", "C", "_CH3", "_CH2", "_CH3"]
+        test_topology = Topology()
+        for site_name_i in site_names * 2:
+            test_topology.add_site(Atom(name=site_name_i))
+        residue_id_list = [1] * len(site_names) + [2] * len(site_names)
+        residue_names_list = ["RES"] * len(site_names) * 2
+
+        [
+            unique_individual_atom_names_dict,
+            individual_atom_names_list,
+            missing_bead_to_atom_name,
+        ] = unique_atom_naming(
+            test_topology,
+            residue_id_list,
+            residue_names_list,
+            bead_to_atom_name_dict={"_CH3": "C", "_CH2": "C"},
+        )
+
+        residue_atom_names = ["C1", "C2", "C3", "H1", "C4", "C5", "C6", "C7"]
+        assert individual_atom_names_list == residue_atom_names * 2
+        assert unique_individual_atom_names_dict == {
+            "1_RES_C1": 1,
+            "1_RES_C2": 2,
+            "1_RES_C3": 3,
+            "1_RES_H1": 4,
+            "1_RES_C4": 5,
+            "1_RES_C5": 6,
+            "1_RES_C6": 7,
+            "1_RES_C7": 8,
+            "2_RES_C1": 9,
+            "2_RES_C2": 10,
+            "2_RES_C3": 11,
+            "2_RES_H1": 12,
+            "2_RES_C4": 13,
+            "2_RES_C5": 14,
+            "2_RES_C6": 15,
+            "2_RES_C7": 16,
+        }
+        assert missing_bead_to_atom_name == []
+
     def test_gomc_fix_bonds_angles_string(self, two_propanol_ua):
         with pytest.raises(
             TypeError,
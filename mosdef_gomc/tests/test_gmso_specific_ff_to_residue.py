@@ -282,6 +282,48 @@ class TestSpecificFFToResidue(BaseTest):
         assert test_nonBonded14Scale_dict == {"ETH": 0.5}
         assert test_residues_applied_list == ["ETH"]
 
+    def test_specific_ff_residue_numbers_atoms_not_in_bonded_order(self):
+        # united atom propane with the atoms ordered _CH3, _CH3, _CH2,
+        # so the atom order does not follow the bonds (0-2 and 1-2)
+        propane_ua = mb.Compound(name="PRO")
+        propane_ch3_0 = mb.Compound(name="_CH3", pos=[0.0, 0.0, 0.0])
+        propane_ch3_1 = mb.Compound(name="_CH3", pos=[0.25, 0.0, 0.0])
+        propane_ch2 = mb.Compound(name="_CH2", pos=[0.125, 0.1, 0.0])
+        propane_ua.add([propane_ch3_0, propane_ch3_1, propane_ch2])
+        propane_ua.add_bond((propane_ch3_0, propane_ch2))
+        propane_ua.add_bond((propane_ch3_1, propane_ch2))
+
+        test_box_propane_ua = mb.fill_box(
+            compound=[propane_ua], n_compounds=[2], box=[3, 3, 3]
+        )
+
+        [
+            test_topology,
+            test_residues_applied_list,
+            test_electrostatics14Scale_dict,
+            test_nonBonded14Scale_dict,
+            test_atom_types_dict,
+            test_bond_types_dict,
+            test_angle_types_dict,
+            test_dihedral_types_dict,
+            test_improper_types_dict,
+            test_combining_rule_dict,
+        ] = specific_ff_to_residue(
+            test_box_propane_ua,
+            forcefield_selection={propane_ua.name: "trappe-ua"},
+            residues=[propane_ua.name],
+            boxes_for_simulation=1,
+        )
+
+        assert test_topology.n_sites == 6
+        assert test_topology.n_bonds == 4
+        assert [
+            site.__dict__["residue_number_"] for site in test_topology.sites
+        ] == [1, 1, 1, 2, 2, 2]
+        assert [
+            site.__dict__["residue_name_"] for site in test_topology.sites
+        ] == ["PRO", "PRO", "PRO", "PRO", "PRO", "PRO"]
+
     def test_specific_ff_to_no_atoms_no_box_dims_in_residue(self):
         with pytest.raises(
             TypeError,
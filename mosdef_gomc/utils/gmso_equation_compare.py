@@ -220,95 +220,54 @@ def get_atom_type_expressions_and_scalars(atom_types_dict):
         "Exp6": "epsilon*alpha/(alpha-6) * (6/alpha*exp(alpha*(1-r/Rmin)) - (Rmin/r)**6)",
     }
 
+    # The LJ, Mie, and Exp6 base forms are tried in this order for each expression.
+    # The expression is the same for every atom type in a residue (and often across
+    # residues), so each expression is only evaluated once and shared by all the atom types.
+    # Example: {expression: [form_output, form_scalar], ...}
+    evaluate_nonbonded_format_functions_list = [
+        ["LJ", evaluate_nonbonded_lj_format_with_scaler],
+        ["Mie", evaluate_nonbonded_mie_format_with_scaler],
+        ["Exp6", evaluate_nonbonded_exp6_format_with_scaler],
+    ]
+    expression_form_and_scalar_dict = {}
+
     atomtypes_data_expression_data_dict = {}
     for res_i in atom_types_dict.keys():
+        expression_iter = atom_types_dict[res_i]["expression"]
         for atom_type_m in atom_types_dict[res_i]["atom_types"]:
             modified_atom_type_iter = f"{res_i}_{atom_type_m.name}"
-            atomtypes_data_dict_iter = {
-                modified_atom_type_iter: {
-                    "expression": None,
-                    "expression_form": None,
-                    "expression_scalar": None,
-                }
-            }
-            expression_iter = atom_types_dict[res_i]["expression"]
-            if (
-                atomtypes_data_dict_iter[modified_atom_type_iter][
-                    "expression_form"
-                ]
-                is None
-                and atomtypes_data_dict_iter[modified_atom_type_iter][
-                    "expression_scalar"
-                ]
-                is None
-            ):
-                [
-                    form_output,
-                    form_scalar,
-                ] = evaluate_nonbonded_lj_format_with_scaler(
-                    expression_iter, eqn_gomc_std_forms_dict["LJ"]
-                )
-                atomtypes_data_dict_iter[modified_atom_type_iter][
-                    "expression"
-                ] = expression_iter
-                atomtypes_data_dict_iter[modified_atom_type_iter][
-                    "expression_form"
-                ] = form_output
-                atomtypes_data_dict_iter[modified_atom_type_iter][
-                    "expression_scalar"
-                ] = form_scalar
 
-            if (
-                atomtypes_data_dict_iter[modified_atom_type_iter][
-                    "expression_form"
-                ]
-                is None
-                and atomtypes_data_dict_iter[modified_atom_type_iter][
-                    "expression_scalar"
-                ]
-                is None
-            ):
-                [
+            if expression_iter not in expression_form_and_scalar_dict:
+                form_output = None
+                form_scalar = None
+                for (
+                    form_name_iter,
+                    evaluate_format_function_iter,
+                ) in evaluate_nonbonded_format_functions_list:
+                    if form_output is None and form_scalar is None:
+                        [
+                            form_output,
+                            form_scalar,
+                        ] = evaluate_format_function_iter(
+                            expression_iter,
+                            eqn_gomc_std_forms_dict[form_name_iter],
+                        )
+
+                expression_form_and_scalar_dict[expression_iter] = [
                     form_output,
                     form_scalar,
-                ] = evaluate_nonbonded_mie_format_with_scaler(
-                    expression_iter, eqn_gomc_std_forms_dict["Mie"]
-                )
-                atomtypes_data_dict_iter[modified_atom_type_iter][
-                    "expression"
-                ] = expression_iter
-                atomtypes_data_dict_iter[modified_atom_type_iter][
-                    "expression_form"
-                ] = form_output
-                atomtypes_data_dict_iter[modified_atom_type_iter][
-                    "expression_scalar"
-                ] = form_scalar
-
-            if (
-                atomtypes_data_dict_iter[modified_atom_type_iter][
-                    "expression_form"
-                ]
-                is None
-                and atomtypes_data_dict_iter[modified_atom_type_iter][
-                    "expression_scalar"
                 ]
-                is None
-            ):
-                [
-                    form_output,
-                    form_scalar,
-                ] = evaluate_nonbonded_exp6_format_with_scaler(
-                    expression_iter, eqn_gomc_std_forms_dict["Exp6"]
-                )
-                atomtypes_data_dict_iter[modified_atom_type_iter][
-                    "expression"
-                ] = expression_iter
-                atomtypes_data_dict_iter[modified_atom_type_iter][
-                    "expression_form"
-                ] = form_output
-                atomtypes_data_dict_iter[modified_atom_type_iter][
-                    "expression_scalar"
-                ] = form_scalar
+
+            [form_output, form_scalar] = expression_form_and_scalar_dict[
+                expression_iter
+            ]
+            atomtypes_data_dict_iter = {
+                modified_atom_type_iter: {
+                    "expression": expression_iter,
+                    "expression_form": form_output,
+                    "expression_scalar": form_scalar,
+                }
+            }
 
             if (
                 atomtypes_data_dict_iter[modified_atom_type_iter]["expression"]
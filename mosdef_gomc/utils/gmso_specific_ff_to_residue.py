@@ -5,6 +5,7 @@ from xml.dom import minidom
 
 import gmso
 import mbuild as mb
+import numpy as np
 from gmso import ForceField
 from gmso.core.views import PotentialFilters
 from gmso.external.convert_mbuild import from_mbuild as mb_convert
@@ -258,6 +259,11 @@ def specific_ff_to_residue(
     but is planned to be supported in the future.
     """
 
+    # scipy.sparse is only imported when the force field is applied,
+    # so importing the package does not load it
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+
     if has_foyer:
         from foyer import Forcefield
         from foyer.forcefields import forcefields
@@ -498,8 +504,6 @@ def specific_ff_to_residue(
 
     # identify the bonded atoms and hence the molecule, label the GMSO objects
     # and create the function outputs.
-    molecule_number = 0  # 0 sets the 1st molecule_number at 1
-    molecules_atom_number_dict = {}
     unique_topology_groups_list = []
     unique_topologies_groups_dict = {}
     atom_types_dict = {}
@@ -580,96 +584,56 @@ def specific_ff_to_residue(
                     f"WARNING: {text_to_print_1}{text_to_print_2}{text_to_print_3}"
                 )
 
-    # get all the bonded atoms, which is used for the bonded map to identify molecules
-    bonded_atom_number_set = set()
-    all_bonded_atoms_list = set()
-    for bond in new_gmso_topology.bonds:
-        bonded_atom_0_iter = new_gmso_topology.get_index(
-            bond.connection_members[0]
-        )
-        bonded_atom_1_iter = new_gmso_topology.get_index(
-            bond.connection_members[1]
-        )
-        if bonded_atom_0_iter < bonded_atom_1_iter:
-            bonded_atom_tuple_iter = (bonded_atom_0_iter, bonded_atom_1_iter)
-        else:
-            bonded_atom_tuple_iter = (bonded_atom_1_iter, bonded_atom_0_iter)
-
-        bonded_atom_number_set.add(bonded_atom_tuple_iter)
-        all_bonded_atoms_list.add(bonded_atom_0_iter)
-        all_bonded_atoms_list.add(bonded_atom_1_iter)
+    # get all the bonded atom numbers as a (n_bonds, 2) array,
+    # which is used for the bonded map to identify molecules.
+    # The atom number of each site is looked up in a dictionary built once,
+    # instead of searching the topology sites for every bonded atom.
+    atom_number_per_site_dict = {
+        site_j: j for j, site_j in enumerate(new_gmso_topology.sites)
+    }
+    bonded_atom_number_array = np.array(
+        [
+            [
+                atom_number_per_site_dict[bond.connection_members[0]],
+                atom_number_per_site_dict[bond.connection_members[1]],
+            ]
+            for bond in new_gmso_topology.bonds
+        ],
+        dtype=int,
+    ).reshape(-1, 2)
 
     """
     build_molecule_list_time_start = time.time()
     """
 
-    # map all bonded atoms as molecules
-    molecules_atom_number_list = []
-    for site_j, site in enumerate(new_gmso_topology.sites):
-        atom_iter_k = new_gmso_topology.get_index(site)
-
-        if atom_iter_k in all_bonded_atoms_list:
-            for bonded_atoms_n in bonded_atom_number_set:
-                if atom_iter_k in bonded_atoms_n:
-                    bonded_atoms_n_list_iter = list(bonded_atoms_n)
-                    atom_found_iter = False
-                    if len(molecules_atom_number_list) != 0:
-                        for molecule_j in range(
-                            0, len(molecules_atom_number_list)
-                        ):
-                            if (
-                                atom_iter_k
-                                in molecules_atom_number_list[molecule_j]
-                            ):
-                                molecules_atom_number_list[molecule_j].add(
-                                    bonded_atoms_n_list_iter[0]
-                                )
-                                molecules_atom_number_list[molecule_j].add(
-                                    bonded_atoms_n_list_iter[1]
-                                )
-                                atom_found_iter = True
-
-                            if (
-                                molecule_j
-                                == len(molecules_atom_number_list) - 1
-                            ) and atom_found_iter is False:
-                                molecules_atom_number_list.append(
-                                    {
-                                        bonded_atoms_n_list_iter[0],
-                                        bonded_atoms_n_list_iter[1],
-                                    }
-                                )
-                    else:
-                        molecules_atom_number_list.append(
-                            {
-                                bonded_atoms_n_list_iter[0],
-                                bonded_atoms_n_list_iter[1],
-                            }
-                        )
-        else:
-            molecules_atom_number_list.append({atom_iter_k})
-
-    # create a molecule number to atom number dict
-    # Example:  {molecule_number_x: {atom_number_1, ..., atom_number_y}, ...}
-    for molecule_iter in range(0, len(molecules_atom_number_list)):
-        molecules_atom_number_dict.update(
-            {molecule_number: molecules_atom_number_list[molecule_iter]}
+    # map all bonded atoms as molecules, using the connected components of the
+    # bonded atom graph, so all the molecules are found in a single scipy call.
+    # The molecules are labeled in the order of their lowest atom number,
+    # and the label of each atom is stored in atom number order.
+    molecule_labels = np.empty(0, dtype=int)
+    if new_gmso_topology.n_sites > 0:
+        bonded_atom_graph = coo_matrix(
+            (
+                np.ones(len(bonded_atom_number_array), dtype=int),
+                (
+                    bonded_atom_number_array[:, 0],
+                    bonded_atom_number_array[:, 1],
+                ),
+            ),
+            shape=(new_gmso_topology.n_sites, new_gmso_topology.n_sites),
+        )
+        _, molecule_labels = connected_components(
+            bonded_atom_graph, directed=False
         )
-        molecule_number += 1
-
-    for site in new_gmso_topology.sites:
-        site_atom_number_iter = new_gmso_topology.get_index(site)
-        # get molecule number
-        for mol_n, atom_set_n in molecules_atom_number_dict.items():
-            if site_atom_number_iter in atom_set_n:
-                molecule_p_number = mol_n
 
+    for site_j, site in enumerate(new_gmso_topology.sites):
         if gmso_match_ff_by == "group":
             site.__dict__["residue_name_"] = site.__dict__["group_"]
         elif gmso_match_ff_by == "molecule":
             site.__dict__["residue_name_"] = site.__dict__["molecule_"].name
 
-        site.__dict__["residue_number_"] = molecule_p_number + 1
+        # the molecule labels start at 0, so the 1st residue_number is 1
+        site.__dict__["residue_number_"] = int(molecule_labels[site_j]) + 1
 
     # create a topolgy only with the bonded parameters, including their residue/molecule type
     # which permit force fielding in GOMC easier in the charmm_writer